@@ -13,17 +13,23 @@ Extracts dates from EXIF metadata (photos) or creation time (videos).
 """
 
 import argparse
-import filecmp
+import errno
+import hashlib
+import mmap
 import os
-import re
+import queue
 import shutil
+import sqlite3
 import subprocess
 import sys
 from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from datetime import datetime
+from contextlib import nullcontext
+from functools import lru_cache
+from datetime import date, datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from threading import Event, Lock, Thread
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
 import exiftool
 from tqdm import tqdm
@@ -32,33 +38,111 @@ PHOTO_EXTENSIONS = {".jpg", ".jpeg", ".arw", ".sr2", ".raf"}
 VIDEO_EXTENSIONS = {".mp4", ".mov"}
 ALL_EXTENSIONS = PHOTO_EXTENSIONS | VIDEO_EXTENSIONS
 
+# -fast2 stops ExifTool from reading MakerNotes (large on ARW/RAF), which
+# dates don't need; -G and -n are pyexiftool's defaults, keeping "EXIF:..." keys.
+# Photos only: -fast2 also stops QuickTime parsing at the mdat atom, and cameras
+# usually write the moov atom (holding the dates) after it
+EXIFTOOL_ARGS = ["-fast2", "-G", "-n", "-api", "largefilesupport=1"]
 
-def discover_files(source_dir: Path) -> Tuple[List[Path], List[Path]]:
+# Videos get plain -fast, which still reads every atom
+VIDEO_EXIFTOOL_ARGS = ["-fast", "-G", "-n", "-api", "largefilesupport=1"]
+
+# Video creation dates, in order of preference
+VIDEO_DATE_TAGS = ["QuickTime:CreateDate", "QuickTime:CreationDate", "QuickTime:MediaCreateDate"]
+
+CACHE_DIR = Path.home() / ".cache" / "organize-media"
+
+
+def discover_files(source_dir: Path, walk_threads: int = 4) -> Tuple[List[Path], List[Path]]:
     """
     Discover media files in source directory.
     Returns (photo_files, video_files).
+
+    Args:
+        source_dir: Directory to walk recursively
+        walk_threads: Number of threads reading directories concurrently (default 4)
     """
     photos = []
     videos = []
-
-    for file_path in source_dir.rglob("*"):
-        if not file_path.is_file():
-            continue
-
-        ext = file_path.suffix.lower()
-        if ext in PHOTO_EXTENSIONS:
-            photos.append(file_path)
-        elif ext in VIDEO_EXTENSIONS:
-            videos.append(file_path)
+    lock = Lock()
+    walk_threads = max(1, walk_threads)
+
+    # Directories waiting to be listed; workers push subdirectories back on
+    pending: queue.Queue = queue.Queue()
+    pending.put(str(source_dir))
+    # Set when the walk is interrupted, so workers drain the queue without listing
+    stop = Event()
+
+    def walk_worker():
+        # Walk with os.scandir so file type and name come straight from the
+        # directory listing, without an extra stat per entry
+        local_photos = []
+        local_videos = []
+        # One lookup sends each file straight to its list
+        buckets = {
+            **dict.fromkeys(PHOTO_EXTENSIONS, local_photos),
+            **dict.fromkeys(VIDEO_EXTENSIONS, local_videos),
+        }
+
+        while True:
+            directory = pending.get()
+            if directory is None:
+                break
+            if stop.is_set():
+                pending.task_done()
+                continue
+
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.put(entry.path)
+                            continue
+
+                        if not entry.is_file(follow_symlinks=False):
+                            continue
+
+                        name = entry.name
+                        dot = name.rfind(".")
+                        if dot <= 0:
+                            # No extension (or a bare dotfile)
+                            continue
+
+                        bucket = buckets.get(name[dot:].lower())
+                        if bucket is not None:
+                            bucket.append(Path(entry.path))
+            except OSError:
+                # Skip unreadable or vanished directories, like rglob did
+                pass
+            finally:
+                pending.task_done()
+
+        with lock:
+            photos.extend(local_photos)
+            videos.extend(local_videos)
+
+    # 4 threads is the sweet spot on APFS, where directory reads share a per-volume lock
+    with ThreadPoolExecutor(max_workers=walk_threads) as executor:
+        for _ in range(walk_threads):
+            executor.submit(walk_worker)
+
+        # Once every queued directory is listed, tell the workers to stop. Also on
+        # Ctrl-C, otherwise the executor would wait forever on workers blocked in get()
+        try:
+            pending.join()
+        finally:
+            stop.set()
+            for _ in range(walk_threads):
+                pending.put(None)
 
     return photos, videos
 
 
-def check_immutable_flags(source_dir: Path) -> bool:
+def check_immutable_flags(source_dir: Path) -> Set[Path]:
     """
     Check if any files have the immutable flag set (macOS 'uchg' flag).
     Uses native find command for reliable macOS flag detection.
-    Returns True if immutable flags found.
+    Returns the set of files with immutable flags (empty if none found).
     """
     try:
         result = subprocess.run(
@@ -67,89 +151,250 @@ def check_immutable_flags(source_dir: Path) -> bool:
             text=True,
             timeout=30
         )
-        # If there's any output, immutable files were found
-        return bool(result.stdout.strip())
+        # Each output line is an immutable file
+        return {Path(line) for line in result.stdout.splitlines() if line}
     except Exception:
         # If find command fails, assume no immutable flags found
         # (user might not be on macOS or find command not available)
-        return False
+        return set()
+
+
+def parse_exif_date(s: str) -> datetime:
+    """
+    Parse an EXIF "YYYY:MM:DD HH:MM:SS" timestamp.
+    Slices the fixed-width fields directly, which is far faster than strptime
+    in per-file loops. Raises ValueError on malformed dates.
+    """
+    if len(s) < 19 or s[4] != ":" or s[7] != ":" or s[10] != " " or s[13] != ":" or s[16] != ":":
+        raise ValueError(f"Unexpected date format: {s}")
+
+    fields = (s[0:4], s[5:7], s[8:10], s[11:13], s[14:16], s[17:19])
+    # int() alone would also take spaces, signs and underscores
+    if not all(field.isdigit() for field in fields):
+        raise ValueError(f"Unexpected date format: {s}")
+
+    return datetime(*map(int, fields))
 
 
 def extract_photo_dates(
     files: List[Path],
     et: exiftool.ExifToolHelper,
-    batch_size: int = 50
-) -> Dict[Path, datetime]:
+    batch_size: int = 50,
+    pbar: Optional[tqdm] = None,
+    pbar_lock: Optional[Lock] = None,
+    on_batch: Optional[Callable[[Dict[Path, datetime]], None]] = None
+) -> Tuple[Dict[Path, datetime], List[Path]]:
     """
     Extract DateTimeOriginal from photo files using batched ExifTool calls.
     Displays progress using tqdm progress bar.
-    Returns dict mapping file path to datetime.
+    Returns (dict mapping file path to datetime, list of files without a usable date).
 
     Args:
         files: List of photo file paths
         et: ExifToolHelper instance
         batch_size: Number of photos to process per batch (default 50)
+        pbar: Shared progress bar to update (default: create one)
+        pbar_lock: Lock guarding updates to a shared progress bar
+        on_batch: Called with the dates found in each batch as soon as it completes
     """
     if not files:
-        return {}
+        return {}, []
 
     tag = "EXIF:DateTimeOriginal"
     results = {}
+    missing = []
     total = len(files)
 
+    if pbar is None:
+        progress = tqdm(total=total, desc="Extracting EXIF", unit="photo")
+    else:
+        progress = nullcontext(pbar)
+    pbar_lock = pbar_lock or nullcontext()
+
     try:
         # Process in batches to show progress
-        with tqdm(total=total, desc="Extracting EXIF", unit="photo") as pbar:
+        with progress as pbar:
             for i in range(0, total, batch_size):
                 batch = files[i:i + batch_size]
                 batch_end = min(i + batch_size, total)
 
                 metadata_list = et.get_tags(batch, tags=tag)
+                batch_dates: Dict[Path, datetime] = {}
 
                 for file_path, metadata in zip(batch, metadata_list):
                     try:
-                        date_str = metadata[tag]
-
-                        if not re.match(r"\d{4}:\d{2}:\d{2} \d{2}:\d{2}:\d{2}", date_str):
-                            raise ValueError(f"Unexpected date format: {date_str}")
-
-                        results[file_path] = datetime.strptime(date_str, "%Y:%m:%d %H:%M:%S")
+                        batch_dates[file_path] = parse_exif_date(str(metadata[tag]))
                     except KeyError:
                         # File doesn't have EXIF:DateTimeOriginal
-                        pass
+                        missing.append(file_path)
+                    except ValueError:
+                        # Malformed date (e.g. "0000:00:00 00:00:00"), treat as missing
+                        missing.append(file_path)
+
+                # Files ExifTool returned nothing for at all
+                missing.extend(batch[len(metadata_list):])
+
+                # Hand the batch over as-is, no per-file lookups back into results
+                results.update(batch_dates)
+                if on_batch is not None:
+                    on_batch(batch_dates)
 
                 # Update progress bar after each batch
-                pbar.update(len(batch))
+                with pbar_lock:
+                    pbar.update(len(batch))
     except Exception as e:
         # If batch processing fails entirely, we'll report it
         raise RuntimeError(f"Failed to extract EXIF data: {e}")
 
-    return results
+    return results, missing
+
+
+def extract_photo_dates_parallel(
+    files: List[Path],
+    batch_size: int = 50,
+    exif_workers: Optional[int] = None,
+    on_batch: Optional[Callable[[Dict[Path, datetime]], None]] = None
+) -> Tuple[Dict[Path, datetime], List[Path]]:
+    """
+    Extract DateTimeOriginal from photo files using one ExifTool process per worker.
+    Files are split into contiguous chunks, each handled by its own ExifToolHelper.
+    Returns (dict mapping file path to datetime, list of files without a usable date).
+
+    Args:
+        files: List of photo file paths
+        batch_size: Number of photos to process per batch (default 50)
+        exif_workers: Number of ExifTool processes (default: CPU count, capped at 8)
+        on_batch: Called with the dates found in each batch as soon as it completes
+    """
+    if not files:
+        return {}, []
+
+    if exif_workers is None:
+        # Cap at 8, more concurrent readers start thrashing spinning disks
+        exif_workers = min(os.cpu_count() or 1, 8)
+
+    # Don't start more ExifTool processes than there are batches to run
+    num_batches = (len(files) + batch_size - 1) // batch_size
+    workers = max(1, min(exif_workers, num_batches))
+    chunk_size = (len(files) + workers - 1) // workers
+    chunks = [files[i:i + chunk_size] for i in range(0, len(files), chunk_size)]
+
+    results: Dict[Path, datetime] = {}
+    missing: List[Path] = []
+    pbar_lock = Lock()
+
+    def extract_chunk(chunk: List[Path]) -> Tuple[Dict[Path, datetime], List[Path]]:
+        with exiftool.ExifToolHelper(common_args=EXIFTOOL_ARGS) as et:
+            return extract_photo_dates(chunk, et, batch_size, pbar, pbar_lock, on_batch)
+
+    with tqdm(total=len(files), desc="Extracting EXIF", unit="photo") as pbar:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(extract_chunk, chunk) for chunk in chunks]
+            for future in as_completed(futures):
+                chunk_results, chunk_missing = future.result()
+                results.update(chunk_results)
+                missing.extend(chunk_missing)
+
+    return results, missing
+
+
+def extract_video_dates(
+    files: List[Path],
+    et: exiftool.ExifToolHelper,
+    batch_size: int = 50,
+    on_batch: Optional[Callable[[Dict[Path, datetime]], None]] = None
+) -> Tuple[Dict[Path, datetime], List[Path]]:
+    """
+    Extract creation dates from video files using batched ExifTool calls.
+    Uses the first QuickTime date tag that is set (not all zeros).
+    Returns (dict mapping file path to datetime, list of files without a usable date).
+
+    Args:
+        files: List of video file paths
+        et: ExifToolHelper instance
+        batch_size: Number of videos to process per batch (default 50)
+        on_batch: Called with the dates found in each batch as soon as it completes
+    """
+    if not files:
+        return {}, []
+
+    results = {}
+    missing = []
+    total = len(files)
+
+    try:
+        with tqdm(total=total, desc="Extracting video dates", unit="video") as pbar:
+            for i in range(0, total, batch_size):
+                batch = files[i:i + batch_size]
+                metadata_list = et.get_tags(batch, tags=VIDEO_DATE_TAGS)
+                batch_dates: Dict[Path, datetime] = {}
+
+                for file_path, metadata in zip(batch, metadata_list):
+                    for tag in VIDEO_DATE_TAGS:
+                        date_str = str(metadata.get(tag, ""))
+                        if not date_str or date_str.startswith("0000:00:00"):
+                            continue
+                        try:
+                            batch_dates[file_path] = parse_exif_date(date_str)
+                            break
+                        except ValueError:
+                            continue
+                    else:
+                        missing.append(file_path)
+
+                # Files ExifTool returned nothing for at all
+                missing.extend(batch[len(metadata_list):])
+
+                results.update(batch_dates)
+                if on_batch is not None:
+                    on_batch(batch_dates)
+
+                pbar.update(len(batch))
+    except Exception as e:
+        raise RuntimeError(f"Failed to extract video dates: {e}")
+
+    return results, missing
 
 
 def extract_video_date(file_path: Path) -> Optional[datetime]:
     """
-    Extract creation time from video file using ffmpeg.
+    Extract creation time from video file using ffprobe.
     Returns datetime or None if not found.
     """
     try:
+        # ffprobe only reads the container header, much cheaper than a full ffmpeg run
         result = subprocess.run(
-            ["ffmpeg", "-i", str(file_path), "-dump"],
+            [
+                "ffprobe", "-v", "quiet",
+                "-show_entries", "format_tags=creation_time",
+                "-of", "default=nw=1:nk=1",
+                str(file_path)
+            ],
             capture_output=True,
             text=True,
             check=False
         )
 
-        for line in result.stderr.split("\n"):
-            if "creation_time" in line:
-                date_str = line.split()[-1]
-                return datetime.fromisoformat(date_str)
+        date_str = result.stdout.strip()
+        if date_str:
+            return datetime.fromisoformat(date_str)
     except Exception:
         pass
 
     return None
 
 
+@lru_cache(maxsize=None)
+def _date_folder(target_dir: Path, day: date, ext: str = "") -> Path:
+    """
+    Build the TARGET/YYYY/YYYY-MM-DD[/ext] folder for a day.
+    Cached since a day's worth of files all share the same folder.
+    """
+    year = f"{day.year:04d}"
+    folder = target_dir / year / f"{year}-{day.month:02d}-{day.day:02d}"
+    return folder / ext if ext else folder
+
+
 def calculate_target_path(
     file_path: Path,
     date: datetime,
@@ -160,19 +405,16 @@ def calculate_target_path(
     Calculate the target path for a file based on its date.
     Format: TARGET/YYYY/YYYY-MM-DD/[ext/]filename
     """
-    year = date.strftime("%Y")
-    day = date.strftime("%Y-%m-%d")
-
-    target = target_dir / year / day
-
-    if group_by_extension:
-        ext = file_path.suffix[1:]  # Remove leading dot
-        target = target / ext
+    ext = file_path.suffix[1:] if group_by_extension else ""  # Remove leading dot
+    return _date_folder(target_dir, date.date(), ext) / file_path.name
 
-    return target / file_path.name
 
-
-def perform_move(source: Path, target: Path) -> Tuple[Path, Path, Optional[str]]:
+def perform_move(
+    source: Path,
+    target: Path,
+    created_dirs: Optional[Set[Path]] = None,
+    dirs_lock: Optional[Lock] = None
+) -> Tuple[Path, Path, Optional[str]]:
     """
     Perform a single file move operation.
     Returns (source, target, error_message) where error_message is None if successful.
@@ -180,10 +422,28 @@ def perform_move(source: Path, target: Path) -> Tuple[Path, Path, Optional[str]]
     Args:
         source: Source file path
         target: Target file path
+        created_dirs: Directories already created by earlier moves, skipped on later ones
+        dirs_lock: Lock guarding created_dirs when moves run in parallel
     """
     try:
-        target.parent.mkdir(parents=True, exist_ok=True)
-        shutil.move(str(source), str(target))
+        parent = target.parent
+        if created_dirs is None:
+            parent.mkdir(parents=True, exist_ok=True)
+        else:
+            # Most files share a handful of date folders, only mkdir each once
+            with dirs_lock or nullcontext():
+                if parent not in created_dirs:
+                    parent.mkdir(parents=True, exist_ok=True)
+                    created_dirs.add(parent)
+
+        try:
+            # Single rename syscall, skipping shutil's extra checks
+            os.replace(source, target)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            # Different filesystems: copy (keeping timestamps) then unlink
+            shutil.move(source, target)
         return (source, target, None)
     except PermissionError as e:
         return (source, target, f"Permission denied: {e}")
@@ -191,26 +451,229 @@ def perform_move(source: Path, target: Path) -> Tuple[Path, Path, Optional[str]]
         return (source, target, f"Move failed: {e}")
 
 
-def check_file_conflict(source: Path, target: Path, check_duplicates: bool = False) -> Optional[str]:
+def _file_digest(path: Path, chunk_size: int = 1024 * 1024) -> bytes:
+    """Hash a file's contents with BLAKE2b, streaming it in chunk_size blocks."""
+    digest = hashlib.blake2b()
+    with open(path, "rb") as f:
+        while True:
+            block = f.read(chunk_size)
+            if not block:
+                return digest.digest()
+            digest.update(block)
+
+
+class DigestCache:
+    """
+    On-disk cache of file content digests, keyed by (path, size, mtime_ns).
+    Lets duplicate checks on re-runs skip reading files already in the target tree.
+    """
+    def __init__(self, db_path: Path):
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Used from the planner thread, guarded by our own lock
+        self.conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        # WAL so concurrent runs don't block each other on the cache
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS digests ("
+            "path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, digest BLOB)"
+        )
+        self.lock = Lock()
+
+    def digest(self, path: Path) -> bytes:
+        """Get the digest for a file, hashing it only if it changed since it was cached."""
+        st = path.stat()
+        key = str(path.absolute())
+
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT size, mtime_ns, digest FROM digests WHERE path = ?", (key,)
+            ).fetchone()
+        if row is not None and row[0] == st.st_size and row[1] == st.st_mtime_ns:
+            return row[2]
+
+        digest = _file_digest(path)
+        # Commit right away, so concurrent runs don't wait on our write lock
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO digests VALUES (?, ?, ?, ?)",
+                (key, st.st_size, st.st_mtime_ns, digest)
+            )
+        return digest
+
+    def close(self):
+        with self.lock:
+            self.conn.commit()
+            self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class DateCache:
+    """
+    On-disk cache of extracted media dates, keyed by (path, size, mtime_ns).
+    Lets re-runs (e.g. after a dry run or an interrupted run) skip ExifTool and
+    ffprobe for files whose dates were already read.
+    """
+    def __init__(self, db_path: Path):
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Written from the ExifTool worker threads, guarded by our own lock
+        self.conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        # WAL so concurrent runs don't block each other on the cache
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS dates ("
+            "path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, date TEXT)"
+        )
+        self.lock = Lock()
+
+    def lookup(self, files: List[Path]) -> Tuple[Dict[Path, datetime], List[Path]]:
+        """
+        Split files into cached dates and files that still need extraction.
+        Returns (dict mapping file path to cached datetime, list of uncached files).
+        """
+        found = {}
+        misses = []
+        with self.lock:
+            for file_path in files:
+                try:
+                    st = file_path.stat()
+                except OSError:
+                    misses.append(file_path)
+                    continue
+                row = self.conn.execute(
+                    "SELECT size, mtime_ns, date FROM dates WHERE path = ?",
+                    (str(file_path.absolute()),)
+                ).fetchone()
+                if row is not None and row[0] == st.st_size and row[1] == st.st_mtime_ns:
+                    found[file_path] = datetime.fromisoformat(row[2])
+                else:
+                    misses.append(file_path)
+        return found, misses
+
+    def store(self, dates: Dict[Path, datetime]):
+        """Remember extracted dates. Must be called before the files are moved."""
+        rows = []
+        for file_path, date in dates.items():
+            try:
+                st = file_path.stat()
+            except OSError:
+                continue
+            rows.append((str(file_path.absolute()), st.st_size, st.st_mtime_ns, date.isoformat()))
+        # Commit each batch, so concurrent runs only wait for one batch and an
+        # interrupted run keeps the dates it already read
+        with self.lock, self.conn:
+            self.conn.executemany("INSERT OR REPLACE INTO dates VALUES (?, ?, ?, ?)", rows)
+
+    def close(self):
+        with self.lock:
+            self.conn.commit()
+            self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _files_equal(
+    a: Path,
+    b: Path,
+    chunk_size: int = 16 * 1024 * 1024,
+    digest_cache: Optional[DigestCache] = None
+) -> bool:
+    """
+    Check whether two files have identical contents.
+    Compares sizes first. With a digest cache, compares a's digest against b's
+    cached one, so b (the file already in the target tree) is read at most once
+    across runs. Otherwise memory-maps both files and compares them in windows
+    of chunk_size bytes (so the comparison is a libc memcmp), stopping at the
+    first differing window. Falls back to buffered reads if mmap fails.
+    """
+    size = a.stat().st_size
+    if size != b.stat().st_size:
+        return False
+    if size == 0:
+        # mmap can't map empty files, and two empty files are always equal
+        return True
+
+    if digest_cache is not None:
+        return _file_digest(a) == digest_cache.digest(b)
+
+    with open(a, "rb") as fa, open(b, "rb") as fb:
+        try:
+            with mmap.mmap(fa.fileno(), 0, access=mmap.ACCESS_READ) as ma, \
+                    mmap.mmap(fb.fileno(), 0, access=mmap.ACCESS_READ) as mb:
+                for offset in range(0, size, chunk_size):
+                    end = offset + chunk_size
+                    if ma[offset:end] != mb[offset:end]:
+                        return False
+                return True
+        except (OSError, ValueError):
+            # Not mappable (e.g. some network filesystems), compare with plain reads
+            pass
+
+        while True:
+            block_a = fa.read(chunk_size)
+            if block_a != fb.read(chunk_size):
+                return False
+            if not block_a:
+                return True
+
+
+def check_file_conflict(
+    source: Path,
+    target: Path,
+    check_duplicates: bool = False,
+    digest_cache: Optional[DigestCache] = None
+) -> Tuple[str, Optional[str]]:
     """
     Check if moving source to target would cause a conflict.
-    Returns error message if conflict exists, None otherwise.
+    Returns (status, error_message) where status is one of:
+        "ok": target doesn't exist, safe to move
+        "duplicate": target exists and is identical (when check_duplicates is set,
+            or when the source is a hardlink to the target)
+        "same": target is the source file itself, nothing to do
+        "conflict": moving would clash, error_message explains why
 
     Args:
         source: Source file path
         target: Target file path
-        check_duplicates: If True, use filecmp to detect if existing file is identical (expensive)
+        check_duplicates: If True, compare contents to detect if existing file is identical (expensive)
+        digest_cache: Cache of target file digests to compare against instead of re-reading targets
     """
     if target.parent.is_file():
-        return f"Target directory {target.parent} is a file"
+        return ("conflict", f"Target directory {target.parent} is a file")
 
-    if target.exists():
-        if check_duplicates and filecmp.cmp(source, target, shallow=False):
-            return None  # Files are identical, this is fine
-        else:
-            return f"Target {target} already exists"
+    try:
+        target_stat = target.stat()
+    except OSError:
+        return ("ok", None)
 
-    return None
+    # Same inode means identical contents, one stat settles it without reading
+    # either file
+    try:
+        source_stat = source.stat()
+    except OSError as e:
+        return ("conflict", f"Cannot stat source: {e}")
+    if source_stat.st_dev == target_stat.st_dev and source_stat.st_ino == target_stat.st_ino:
+        # The very same directory entry (re-run over the target tree) is already in
+        # place. Compared per directory and case-insensitively, so on APFS a
+        # differently-cased path is never mistaken for a second link
+        if (source.name.casefold() == target.name.casefold()
+                and os.path.samefile(source.parent, target.parent)):
+            return ("same", None)
+        # A hardlink into the archive, the source can be deleted
+        return ("duplicate", None)
+
+    if check_duplicates and _files_equal(source, target, digest_cache=digest_cache):
+        return ("duplicate", None)  # Files are identical, this is fine
+    else:
+        return ("conflict", f"Target {target} already exists")
 
 
 def organize_media(
@@ -221,7 +684,11 @@ def organize_media(
     batch_size: int = 50,
     skip_flag_check: bool = False,
     check_duplicates: bool = False,
-    overwrite: bool = False
+    overwrite: bool = False,
+    walk_threads: int = 4,
+    exif_workers: Optional[int] = None,
+    use_digest_cache: bool = True,
+    use_date_cache: bool = True
 ) -> int:
     """
     Main organizing logic.
@@ -236,6 +703,10 @@ def organize_media(
         skip_flag_check: Skip checking for immutable flags on source files
         check_duplicates: Use expensive file comparison to detect duplicates (default: False)
         overwrite: Skip conflict checks and overwrite existing files (default: False)
+        walk_threads: Number of threads used to discover files (default: 4)
+        exif_workers: Number of parallel ExifTool processes (default: CPU count, max 8)
+        use_digest_cache: Cache target file digests on disk for duplicate checks (default: True)
+        use_date_cache: Cache extracted dates on disk for re-runs (default: True)
     """
     if not source_dir.is_dir():
         print(f"Error: Source '{source_dir}' is not a directory", file=sys.stderr)
@@ -246,122 +717,242 @@ def organize_media(
         return 1
 
     print(f"Discovering files in {source_dir}...")
-    photos, videos = discover_files(source_dir)
+    photos, videos = discover_files(source_dir, walk_threads)
     print(f"Found {len(photos)} photos, {len(videos)} videos")
 
+    errors: List[Tuple[Path, str]] = []
+
     # Check for immutable flags before processing
     if not skip_flag_check:
-        if check_immutable_flags(source_dir):
-            print(f"\n⚠️  Warning: Found files with immutable flags (uchg)")
-            print(f"These files cannot be moved until flags are removed.")
+        immutable = check_immutable_flags(source_dir)
+        if immutable:
+            print(f"\n⚠️  Warning: Found {len(immutable)} files with immutable flags (uchg)")
+            print(f"These files cannot be moved until flags are removed, skipping them.")
             print(f"\nTo fix, run:")
             print(f"  sudo chflags -R nouchg {source_dir}")
             print()
-            response = input("Continue anyway? [y/N]: ").strip().lower()
-            if response not in ('y', 'yes'):
-                print("Aborted.")
-                return 0
-
-    # Extract dates from all media files
-    file_dates: Dict[Path, datetime] = {}
-    errors: List[Tuple[Path, str]] = []
 
-    # Process photos in batch
-    if photos:
-        try:
-            with exiftool.ExifToolHelper() as et:
-                photo_dates = extract_photo_dates(photos, et, batch_size)
-                file_dates.update(photo_dates)
-
-                # Track photos that failed
-                for photo in photos:
-                    if photo not in photo_dates:
-                        errors.append((photo, "No EXIF:DateTimeOriginal found"))
-        except Exception as e:
-            print(f"Error processing photos: {e}", file=sys.stderr)
-            return 1
-
-    # Process videos individually (ffmpeg doesn't batch well)
-    if videos:
-        for video in tqdm(videos, desc="Processing videos", unit="video"):
-            date = extract_video_date(video)
-            if date:
-                file_dates[video] = date
-            else:
-                errors.append((video, "No creation_time found"))
-
-    # Plan all moves
+            # Skip them up front instead of failing each move later
+            skipped = [f for f in photos + videos if f in immutable]
+            photos = [f for f in photos if f not in immutable]
+            videos = [f for f in videos if f not in immutable]
+            errors.extend((f, "Immutable flag (uchg) set") for f in skipped)
     moves: List[Tuple[Path, Path]] = []
     duplicates: List[Tuple[Path, Path]] = []
+    move_futures = []
+    created_dirs: Set[Path] = set()
+    dirs_lock = Lock()
+
+    # On the same device a move is just a rename, so extra threads only add churn
+    # (and thrash spinning disks); across devices it's a full copy, where 8 threads
+    # give balanced parallel I/O between the volumes
+    same_dev = os.stat(source_dir).st_dev == os.stat(target_dir).st_dev
+    move_workers = 1 if same_dev else 8
 
-    for file_path, date in file_dates.items():
-        target_path = calculate_target_path(file_path, date, target_dir, group_by_extension)
+    # Dated files are planned as soon as each extraction batch completes, so
+    # moves overlap with the remaining EXIF/video extraction instead of waiting for it
+    dated: queue.Queue = queue.Queue()
 
-        if overwrite:
-            # Skip conflict checks, just move/overwrite
-            moves.append((file_path, target_path))
+    planning_failed = False
+
+    def plan_worker(executor: ThreadPoolExecutor):
+        nonlocal planning_failed
+        try:
+            while True:
+                batch = dated.get()
+                if batch is None:
+                    break
+
+                batch_moves: List[Tuple[Path, Path]] = []
+                for file_path, date in batch.items():
+                    try:
+                        target_path = calculate_target_path(file_path, date, target_dir, group_by_extension)
+
+                        if overwrite:
+                            # Skip conflict checks, just move/overwrite
+                            pass
+                        else:
+                            status, conflict = check_file_conflict(
+                                file_path, target_path, check_duplicates, digest_cache
+                            )
+                            if status == "conflict":
+                                # When check_duplicates is disabled, we don't know if they're duplicates
+                                errors.append((file_path, conflict))
+                                continue
+
+                            if status == "same":
+                                # File is already where it belongs
+                                continue
+
+                            if status == "duplicate":
+                                # Target exists and is identical (check_duplicates=True, or a hardlink)
+                                duplicates.append((file_path, target_path))
+                                continue
+
+                        batch_moves.append((file_path, target_path))
+                    except Exception as e:
+                        # Keep planning the rest, e.g. a source that vanished or an unreadable target
+                        errors.append((file_path, f"Planning failed: {e}"))
+
+                # Move files in destination folder order so each folder is touched in one run,
+                # keeping the filesystem's directory caches warm
+                batch_moves.sort(key=lambda move: move[1].parent)
+                moves.extend(batch_moves)
+                if not dry_run:
+                    for source, target in batch_moves:
+                        move_futures.append(executor.submit(
+                            perform_move, source, target, created_dirs, dirs_lock
+                        ))
+        except Exception as e:
+            # Don't let a dead planner pass for a run with nothing to move
+            print(f"Error planning moves: {e}", file=sys.stderr)
+            planning_failed = True
+
+    # Remember digests of files already in the target tree, so duplicate checks
+    # on re-runs don't read the whole archive again
+    digest_cache = None
+    if check_duplicates and use_digest_cache:
+        try:
+            digest_cache = DigestCache(CACHE_DIR / "digests.sqlite")
+        except (OSError, sqlite3.Error) as e:
+            print(f"Warning: Digest cache unavailable, continuing without it: {e}", file=sys.stderr)
+
+    # Remember extracted dates, so re-running on the same source skips extraction
+    date_cache = None
+    if use_date_cache:
+        try:
+            date_cache = DateCache(CACHE_DIR / "dates.sqlite")
+        except (OSError, sqlite3.Error) as e:
+            print(f"Warning: Date cache unavailable, continuing without it: {e}", file=sys.stderr)
+
+    def record_dates(batch: Dict[Path, datetime]):
+        # Cache before queueing, the planner may move the files right away
+        if date_cache is not None:
+            date_cache.store(batch)
+        dated.put(batch)
+
+    with ThreadPoolExecutor(max_workers=move_workers) as executor, \
+            digest_cache or nullcontext(), date_cache or nullcontext():
+        planner = Thread(target=plan_worker, args=(executor,))
+        planner.start()
+
+        extraction_failed = False
+        try:
+            # Only files without a cached date go through ExifTool/ffprobe
+            if date_cache is not None:
+                cached, photos = date_cache.lookup(photos)
+                cached_videos, videos = date_cache.lookup(videos)
+                cached.update(cached_videos)
+                if cached:
+                    print(f"Using cached dates for {len(cached)} files")
+                    dated.put(cached)
+
+            # Process photos in batch
+            if photos:
+                try:
+                    _, missing = extract_photo_dates_parallel(
+                        photos, batch_size, exif_workers, on_batch=record_dates
+                    )
+
+                    # Track photos that failed
+                    errors.extend((photo, "No EXIF:DateTimeOriginal found") for photo in missing)
+                except Exception as e:
+                    print(f"Error processing photos: {e}", file=sys.stderr)
+                    extraction_failed = True
+
+            # Process videos in batch through a single ExifTool process
+            no_video_date = []
+            if videos and not extraction_failed:
+                # Videos already queued for planning, so a failure doesn't probe them again
+                videos_dated: Set[Path] = set()
+
+                def record_video_dates(batch: Dict[Path, datetime]):
+                    videos_dated.update(batch)
+                    record_dates(batch)
+
+                try:
+                    with exiftool.ExifToolHelper(common_args=VIDEO_EXIFTOOL_ARGS) as et:
+                        _, no_video_date = extract_video_dates(
+                            videos, et, batch_size, on_batch=record_video_dates
+                        )
+                except Exception as e:
+                    # Not fatal, videos without a date yet get the ffprobe fallback below
+                    print(f"Error processing videos with ExifTool: {e}", file=sys.stderr)
+                    no_video_date = [video for video in videos if video not in videos_dated]
+
+            # Fall back to one ffprobe call per video ExifTool found no date for,
+            # several at a time
+            if no_video_date:
+                video_workers = min(8, os.cpu_count() or 1)
+                with ThreadPoolExecutor(max_workers=video_workers) as video_executor:
+                    futures = {
+                        video_executor.submit(extract_video_date, video): video
+                        for video in no_video_date
+                    }
+
+                    with tqdm(total=len(no_video_date), desc="Probing videos", unit="video") as pbar:
+                        for future in as_completed(futures):
+                            video = futures[future]
+                            date = future.result()
+                            if date:
+                                record_dates({video: date})
+                            else:
+                                errors.append((video, "No creation_time found"))
+                            pbar.update(1)
+        finally:
+            dated.put(None)
+            planner.join()
+
+        failed = extraction_failed or planning_failed
+        if failed:
+            # Let moves already in flight finish, but don't start any more
+            started = [future for future in move_futures if not future.cancel()]
+            if len(started) < len(move_futures):
+                print(f"\nCancelled {len(move_futures) - len(started)} planned moves, "
+                      f"their files stay in the source")
+            move_futures = started
+
+        # Report what will happen
+        print(f"\nPlanned operations:")
+        print(f"  Moves: {len(moves)}")
+        print(f"  Duplicates (can delete): {len(duplicates)}")
+        print(f"  Errors: {len(errors)}")
+
+        if dry_run:
+            moves.sort(key=lambda move: move[1].parent)
+            print("\nDry run mode - showing first 10 moves:")
+            for source, target in moves[:10]:
+                print(f"  {source} -> {target}")
+            if len(moves) > 10:
+                print(f"  ... and {len(moves) - 10} more")
+
+            if duplicates:
+                print(f"\nDuplicates (can delete source):")
+                for source, target in duplicates[:5]:
+                    print(f"  {source} (identical to {target})")
+                if len(duplicates) > 5:
+                    print(f"  ... and {len(duplicates) - 5} more")
         else:
-            conflict = check_file_conflict(file_path, target_path, check_duplicates)
-            if conflict:
-                # When check_duplicates is enabled and no conflict returned, it means files are identical
-                # When check_duplicates is disabled, we don't know if they're duplicates
-                errors.append((file_path, conflict))
-            else:
-                # No conflict - either target doesn't exist, or it's an identical file (when check_duplicates=True)
-                if target_path.exists():
-                    # Target exists and is identical (only possible when check_duplicates=True)
-                    duplicates.append((file_path, target_path))
-                else:
-                    moves.append((file_path, target_path))
-
-    # Report what will happen
-    print(f"\nPlanned operations:")
-    print(f"  Moves: {len(moves)}")
-    print(f"  Duplicates (can delete): {len(duplicates)}")
-    print(f"  Errors: {len(errors)}")
-
-    if dry_run:
-        print("\nDry run mode - showing first 10 moves:")
-        for source, target in moves[:10]:
-            print(f"  {source} -> {target}")
-        if len(moves) > 10:
-            print(f"  ... and {len(moves) - 10} more")
-
-        if duplicates:
-            print(f"\nDuplicates (can delete source):")
-            for source, target in duplicates[:5]:
-                print(f"  {source} (identical to {target})")
-            if len(duplicates) > 5:
-                print(f"  ... and {len(duplicates) - 5} more")
-    else:
-        # Execute moves with thread pool for parallel I/O
-        print("\nMoving files...")
-        move_errors = 0
-
-        # Use ThreadPoolExecutor for parallel moves (8 threads for balanced I/O on separate volumes)
-        with ThreadPoolExecutor(max_workers=8) as executor:
-            # Submit all move tasks
-            futures = {
-                executor.submit(perform_move, source, target): (source, target)
-                for source, target in moves
-            }
+            # Moves started during extraction; wait for the rest to complete
+            print("\nMoving files...")
+            move_errors = 0
 
             # Process completed moves with progress bar
-            with tqdm(total=len(moves), desc="Progress", unit="file") as pbar:
-                for future in as_completed(futures):
+            with tqdm(total=len(move_futures), desc="Progress", unit="file") as pbar:
+                for future in as_completed(move_futures):
                     source, target, error = future.result()
                     if error:
                         errors.append((source, error))
                         move_errors += 1
                     pbar.update(1)
 
-        if move_errors == 0:
-            print("All moves completed successfully!")
+            if move_errors == 0 and not failed:
+                print("All moves completed successfully!")
 
-        if duplicates:
-            print(f"\nFound {len(duplicates)} duplicate files (can be deleted):")
-            for source, target in duplicates:
-                print(f"  {source}")
+            if duplicates:
+                print(f"\nFound {len(duplicates)} duplicate files (can be deleted):")
+                for source, target in duplicates:
+                    print(f"  {source}")
 
     # Report errors
     if errors:
@@ -370,7 +961,7 @@ def organize_media(
             print(f"  {file_path}: {error}", file=sys.stderr)
         return 1
 
-    return 0
+    return 1 if failed else 0
 
 
 def main():
@@ -419,6 +1010,28 @@ def main():
         action="store_true",
         help="Overwrite existing files without checking (fastest, default: disabled)"
     )
+    parser.add_argument(
+        "--walk-threads",
+        type=int,
+        default=4,
+        help="Number of threads used to discover files (default: 4)"
+    )
+    parser.add_argument(
+        "--exif-workers",
+        type=int,
+        default=None,
+        help="Number of parallel ExifTool processes (default: CPU count, max 8)"
+    )
+    parser.add_argument(
+        "--no-digest-cache",
+        action="store_true",
+        help="Don't cache target file digests for --check-duplicates across runs"
+    )
+    parser.add_argument(
+        "--no-date-cache",
+        action="store_true",
+        help="Don't cache extracted dates across runs"
+    )
 
     args = parser.parse_args()
 
@@ -430,7 +1043,11 @@ def main():
         batch_size=args.batch_size,
         skip_flag_check=args.skip_flag_check,
         check_duplicates=args.check_duplicates,
-        overwrite=args.overwrite
+        overwrite=args.overwrite,
+        walk_threads=args.walk_threads,
+        exif_workers=args.exif_workers,
+        use_digest_cache=not args.no_digest_cache,
+        use_date_cache=not args.no_date_cache
     )
 
     sys.exit(exit_code)
@@ -26,44 +26,96 @@ Keys:
     0: Clear all tags
 """
 
+import bisect
+import os
 import sys
 from pathlib import Path
-from PIL import Image, ImageOps
+from PIL import Image
 import io
 from collections import OrderedDict
-from threading import Thread, Lock
+from threading import Condition, Event, Thread, Lock
 from PyQt5.QtWidgets import QApplication, QMainWindow, QLabel, QStatusBar, QWidget, QHBoxLayout, QMessageBox
 from PyQt5.QtGui import QPixmap, QImage, QPainter, QColor, QPalette
-from PyQt5.QtCore import Qt, QTimer, QCoreApplication
-from osxmetadata import (
-    OSXMetaData,
-    Tag,
-    FINDER_COLOR_RED,
-    FINDER_COLOR_ORANGE,
-    FINDER_COLOR_YELLOW,
-    FINDER_COLOR_GREEN,
-    FINDER_COLOR_BLUE,
-    FINDER_COLOR_PURPLE,
-    FINDER_COLOR_GRAY,
-)
+from PyQt5.QtCore import Qt, QTimer, QCoreApplication, pyqtSignal
 
 # Supported image extensions (JPEG only)
 IMAGE_EXTENSIONS = {'.jpg', '.jpeg'}
 
-# macOS color tags mapping
-COLOR_TAGS = {
-    1: (Tag("Red", FINDER_COLOR_RED), QColor(255, 59, 48)),       # macOS Red
-    2: (Tag("Orange", FINDER_COLOR_ORANGE), QColor(255, 149, 0)),    # macOS Orange
-    3: (Tag("Yellow", FINDER_COLOR_YELLOW), QColor(255, 204, 0)),    # macOS Yellow
-    4: (Tag("Green", FINDER_COLOR_GREEN), QColor(40, 205, 65)),     # macOS Green
-    5: (Tag("Blue", FINDER_COLOR_BLUE), QColor(0, 122, 255)),      # macOS Blue
-    6: (Tag("Purple", FINDER_COLOR_PURPLE), QColor(175, 82, 222)),   # macOS Purple
-    7: (Tag("Gray", FINDER_COLOR_GRAY), QColor(142, 142, 147)),    # macOS Gray
+# macOS color tags mapping and its reverse lookup from tag to display color,
+# filled in by load_color_tags()
+COLOR_TAGS = {}
+TAG_TO_COLOR = {}
+OSXMetaData = None
+
+
+def load_color_tags():
+    """
+    Import osxmetadata and build the color tag tables.
+    Deferred until the viewer starts, since importing osxmetadata loads the
+    Cocoa bridges, which takes hundreds of ms.
+    """
+    global OSXMetaData
+    if OSXMetaData is not None:
+        return
+
+    from osxmetadata import (
+        OSXMetaData as _OSXMetaData,
+        Tag,
+        FINDER_COLOR_RED,
+        FINDER_COLOR_ORANGE,
+        FINDER_COLOR_YELLOW,
+        FINDER_COLOR_GREEN,
+        FINDER_COLOR_BLUE,
+        FINDER_COLOR_PURPLE,
+        FINDER_COLOR_GRAY,
+    )
+
+    COLOR_TAGS.update({
+        1: (Tag("Red", FINDER_COLOR_RED), QColor(255, 59, 48)),       # macOS Red
+        2: (Tag("Orange", FINDER_COLOR_ORANGE), QColor(255, 149, 0)),    # macOS Orange
+        3: (Tag("Yellow", FINDER_COLOR_YELLOW), QColor(255, 204, 0)),    # macOS Yellow
+        4: (Tag("Green", FINDER_COLOR_GREEN), QColor(40, 205, 65)),     # macOS Green
+        5: (Tag("Blue", FINDER_COLOR_BLUE), QColor(0, 122, 255)),      # macOS Blue
+        6: (Tag("Purple", FINDER_COLOR_PURPLE), QColor(175, 82, 222)),   # macOS Purple
+        7: (Tag("Gray", FINDER_COLOR_GRAY), QColor(142, 142, 147)),    # macOS Gray
+    })
+    TAG_TO_COLOR.update({tag_obj: color for tag_obj, color in COLOR_TAGS.values()})
+    OSXMetaData = _OSXMetaData
+
+
+def color_tags(tags):
+    """Pick out the color tags from a file's tags as (name, QColor) pairs."""
+    # Scan the file's (usually 0-1) tags rather than all 7 colors
+    return [(t.name, TAG_TO_COLOR[t]) for t in tags if t in TAG_TO_COLOR]
+
+
+# EXIF orientation tag value -> transpose that puts the image upright
+EXIF_ORIENTATION = 0x0112
+ORIENTATION_TRANSPOSE = {
+    2: Image.Transpose.FLIP_LEFT_RIGHT,
+    3: Image.Transpose.ROTATE_180,
+    4: Image.Transpose.FLIP_TOP_BOTTOM,
+    5: Image.Transpose.TRANSPOSE,
+    6: Image.Transpose.ROTATE_270,
+    7: Image.Transpose.TRANSVERSE,
+    8: Image.Transpose.ROTATE_90,
 }
 
 
+def apply_exif_orientation(img):
+    """
+    Rotate/flip an image according to its EXIF orientation tag.
+    Unlike ImageOps.exif_transpose, upright images are returned as-is instead
+    of copied, and the (already draft-reduced) image is transposed only once.
+    """
+    method = ORIENTATION_TRANSPOSE.get(img.getexif().get(EXIF_ORIENTATION, 1))
+    if method is None:
+        return img
+    return img.transpose(method)
+
+
 class ImageCache:
-    """LRU cache for loaded PIL images."""
+    """LRU cache for loaded PIL images (or any other per-image data)."""
     def __init__(self, max_size=15):
         self.cache = OrderedDict()
         self.max_size = max_size
@@ -111,13 +163,7 @@ class TagCache:
         """Read tags directly from file."""
         try:
             meta = OSXMetaData(str(path))
-            tags = meta.tags
-
-            result = []
-            for num, (tag_obj, color) in COLOR_TAGS.items():
-                if tag_obj in tags:
-                    result.append((tag_obj.name, color))
-            return result
+            return color_tags(meta.tags)
         except Exception as e:
             print(f"Error reading tags from {path.name}: {e}", file=sys.stderr)
             return []
@@ -130,26 +176,66 @@ class TagCache:
                 self.cache[path] = self._read_tags(path)
             return self.cache[path]
 
-    def invalidate(self, path):
-        """Invalidate cache entry after tag modification."""
+    def set(self, path, tags):
+        """Store the tags just written to a file, avoiding a re-read."""
         with self.lock:
-            if path in self.cache:
-                self.cache[path] = self._read_tags(path)
+            self.cache[path] = color_tags(tags)
 
 
 class ImageViewer(QMainWindow):
+    # Emitted from decode threads with (index, image), delivered on the GUI thread
+    image_loaded = pyqtSignal(int, object)
+
     def __init__(self, image_files, start_index=0):
         super().__init__()
 
-        self.image_files = sorted(image_files)
+        # Index of the most recently requested image; decodes finishing for any
+        # other index (skipped past while scrolling quickly) are dropped
+        self._pending_index = None
+        self.image_loaded.connect(self.on_image_loaded)
+
+        # A single decode thread serves the displayed image. Navigation only
+        # replaces its (index, path) request, so holding an arrow key decodes
+        # the latest image instead of piling up a decode per keypress
+        self._decode_request = None
+        self._decode_cond = Condition()
+        Thread(target=self._decode_loop, daemon=True).start()
+
+        # Paths being decoded right now, so the display thread and preloads
+        # wait on one decode of a file instead of each running their own
+        self._inflight = {}
+        self._inflight_lock = Lock()
+
+        # High-quality redraw once a live window resize settles
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(50)
+        self._resize_timer.timeout.connect(self.update_display)
+        # Last LANCZOS-quality pixmap shown, source for quick previews while resizing
+        self._display_pixmap = None
+
+        self.image_files = sorted(image_files, key=lambda p: p.name)
         self.current_index = start_index
         self.current_pil_image = None
 
+        # JPEGs are decoded at reduced scale, just big enough to fill the screen
+        # (so fullscreen still gets full quality) in both orientations
+        screen_size = QApplication.primaryScreen().size()
+        self.decode_size = max(screen_size.width(), screen_size.height())
+
         # Initialize caches
         self.image_cache = ImageCache(max_size=15)
+        # Resized pixmaps keyed by (path, width, height), so toggling fullscreen
+        # or revisiting an image at the same size skips the LANCZOS resize
+        self.pixmap_cache = ImageCache(max_size=8)
         self.tag_cache = TagCache()
 
+        # OSXMetaData for the image being tagged, reused across keypresses
+        self._meta = None
+        self._meta_path = None
+
         # Start preloading tags in background
+        load_color_tags()
         self.tag_cache.preload(self.image_files)
 
         # Setup main window
@@ -182,19 +268,39 @@ class ImageViewer(QMainWindow):
 
     def load_image(self, path):
         """Load an image file, handling RAW formats via exiftool and EXIF orientation."""
-        # Check cache first
-        cached_img = self.image_cache.get(path)
-        if cached_img is not None:
-            return cached_img
+        with self._inflight_lock:
+            # Check cache first
+            cached_img = self.image_cache.get(path)
+            if cached_img is not None:
+                return cached_img
+
+            done = self._inflight.get(path)
+            if done is None:
+                self._inflight[path] = Event()
+
+        if done is not None:
+            # Another thread is decoding it already, use its result
+            done.wait()
+            return self.image_cache.get(path)
 
-        # Load from disk
+        try:
+            return self._decode_image(path)
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(path).set()
+
+    def _decode_image(self, path):
+        """Decode an image file from disk and cache it."""
         try:
             # Try loading directly with PIL first
             try:
                 img = Image.open(path)
+                # Let libjpeg scale the DCT down by 1/2, 1/4 or 1/8 while decoding,
+                # skipping most of the work for pixels we'd throw away when resizing
+                img.draft("RGB", (self.decode_size, self.decode_size))
                 img.load()  # Force load to catch any issues
                 # Apply EXIF orientation (handles portrait/rotated images)
-                img = ImageOps.exif_transpose(img)
+                img = apply_exif_orientation(img)
                 # Cache the loaded image
                 self.image_cache.put(path, img)
                 return img
@@ -208,7 +314,7 @@ class ImageViewer(QMainWindow):
                         if result:
                             img = Image.open(io.BytesIO(result))
                             # Apply EXIF orientation for RAW preview
-                            img = ImageOps.exif_transpose(img)
+                            img = apply_exif_orientation(img)
                             # Cache the loaded image
                             self.image_cache.put(path, img)
                             return img
@@ -223,7 +329,8 @@ class ImageViewer(QMainWindow):
         if pil_image.mode != "RGB":
             pil_image = pil_image.convert("RGB")
 
-        # Convert to bytes
+        # Convert to bytes. The QImage only borrows data, which stays alive
+        # until fromImage has made its copy.
         data = pil_image.tobytes("raw", "RGB")
         qimage = QImage(data, pil_image.width, pil_image.height, pil_image.width * 3, QImage.Format_RGB888)
         return QPixmap.fromImage(qimage)
@@ -232,24 +339,32 @@ class ImageViewer(QMainWindow):
         """Get color tags for a file."""
         return self.tag_cache.get(path)
 
+    def _meta_for(self, path):
+        """Get the OSXMetaData for a file, reusing it while the same file is tagged."""
+        if self._meta_path != path:
+            self._meta = OSXMetaData(str(path))
+            self._meta_path = path
+        return self._meta
+
     def set_file_tag(self, path, tag_number):
         """Set a color tag on a file (toggles if already set)."""
         try:
             if tag_number not in COLOR_TAGS:
                 return
 
-            meta = OSXMetaData(str(path))
+            meta = self._meta_for(path)
             tag_obj, color = COLOR_TAGS[tag_number]
 
             # Toggle: if tag exists, remove it; otherwise add it
             current_tags = meta.tags
             if tag_obj in current_tags:
-                meta.tags = [t for t in current_tags if t != tag_obj]
+                new_tags = [t for t in current_tags if t != tag_obj]
             else:
-                meta.tags = list(current_tags) + [tag_obj]
+                new_tags = list(current_tags) + [tag_obj]
+            meta.tags = new_tags
 
-            # Invalidate cache and refresh the status bar
-            self.tag_cache.invalidate(path)
+            # Update cache from what we just wrote and refresh the status bar
+            self.tag_cache.set(path, new_tags)
             tags = self.get_file_tags(path)
             tag_html = self.get_tag_html(tags)
             status_text = f"{self.current_index + 1}/{len(self.image_files)} - {path.name}{tag_html}"
@@ -261,14 +376,14 @@ class ImageViewer(QMainWindow):
     def clear_file_tags(self, path):
         """Clear all color tags from a file."""
         try:
-            meta = OSXMetaData(str(path))
+            meta = self._meta_for(path)
             # Remove all color tags
             current_tags = meta.tags
-            color_tag_objs = [tag_obj for tag_obj, _ in COLOR_TAGS.values()]
-            meta.tags = [t for t in current_tags if t not in color_tag_objs]
+            new_tags = [t for t in current_tags if t not in TAG_TO_COLOR]
+            meta.tags = new_tags
 
-            # Invalidate cache and refresh the status bar
-            self.tag_cache.invalidate(path)
+            # Update cache from what we just wrote and refresh the status bar
+            self.tag_cache.set(path, new_tags)
             status_text = f"{self.current_index + 1}/{len(self.image_files)} - {path.name}"
             self.status_label.setText(status_text)
 
@@ -304,8 +419,40 @@ class ImageViewer(QMainWindow):
         self.status_label.setText(status_text)
         self.setWindowTitle(f"Image Viewer - {path.name}")
 
-        # Load image
-        self.current_pil_image = self.load_image(path)
+        self._pending_index = self.current_index
+
+        # Show cached images right away
+        cached_img = self.image_cache.get(path)
+        if cached_img is not None:
+            self.on_image_loaded(self.current_index, cached_img)
+            return
+
+        # Otherwise decode off the GUI thread so navigation never blocks; clear
+        # the old image meanwhile so it isn't shown under the new file's name
+        self.current_pil_image = None
+        self._display_pixmap = None
+        self.image_label.clear()
+
+        with self._decode_cond:
+            self._decode_request = (self.current_index, path)
+            self._decode_cond.notify()
+
+    def _decode_loop(self):
+        """Decode the most recently requested image, forever (runs on the decode thread)."""
+        while True:
+            with self._decode_cond:
+                while self._decode_request is None:
+                    self._decode_cond.wait()
+                index, path = self._decode_request
+                self._decode_request = None
+            self.image_loaded.emit(index, self.load_image(path))
+
+    def on_image_loaded(self, index, image):
+        """Display a decoded image, unless the user has already moved on."""
+        if index != self._pending_index:
+            return
+
+        self.current_pil_image = image
         if self.current_pil_image is None:
             return
 
@@ -334,8 +481,8 @@ class ImageViewer(QMainWindow):
         # Start background threads to load these images
         for idx in indices_to_preload:
             path = self.image_files[idx]
-            # Skip if already cached
-            if self.image_cache.get(path) is not None:
+            # Skip if already cached or being decoded
+            if self.image_cache.get(path) is not None or path in self._inflight:
                 continue
 
             # Load in background thread
@@ -344,14 +491,26 @@ class ImageViewer(QMainWindow):
 
             Thread(target=load_worker, daemon=True).start()
 
+    def display_key(self):
+        """Key for the current image at the current available size (window minus status bar)."""
+        return (
+            self.image_files[self.current_index],
+            self.width(),
+            self.height() - self.status_bar.height(),
+        )
+
     def update_display(self):
         """Update the display with the current image scaled to fit window."""
         if self.current_pil_image is None:
             return
 
-        # Get available space (window size minus status bar)
-        available_width = self.width()
-        available_height = self.height() - self.status_bar.height()
+        key = self.display_key()
+        _, available_width, available_height = key
+        pixmap = self.pixmap_cache.get(key)
+        if pixmap is not None:
+            self._display_pixmap = pixmap
+            self.image_label.setPixmap(pixmap)
+            return
 
         # Calculate scaling to fit while maintaining aspect ratio
         img_width, img_height = self.current_pil_image.size
@@ -359,13 +518,28 @@ class ImageViewer(QMainWindow):
         new_width = int(img_width * scale)
         new_height = int(img_height * scale)
 
-        # Resize with high quality
-        resized_image = self.current_pil_image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        # Resize with high quality; reducing_gap first shrinks big images by an
+        # integer factor with the much cheaper Image.reduce() before the LANCZOS pass
+        resized_image = self.current_pil_image.resize(
+            (new_width, new_height), Image.Resampling.LANCZOS, reducing_gap=2.0
+        )
 
         # Convert to QPixmap and display
         pixmap = self.pil_to_qpixmap(resized_image)
+        self.pixmap_cache.put(key, pixmap)
+        self._display_pixmap = pixmap
         self.image_label.setPixmap(pixmap)
 
+    def preview_display(self):
+        """Quickly rescale the last shown pixmap with Qt, for live window resizing."""
+        if self._display_pixmap is None:
+            return
+
+        _, available_width, available_height = self.display_key()
+        self.image_label.setPixmap(self._display_pixmap.scaled(
+            available_width, available_height, Qt.KeepAspectRatio, Qt.SmoothTransformation
+        ))
+
     def next_image(self):
         """Show next image."""
         if self.current_index < len(self.image_files) - 1:
@@ -518,7 +692,16 @@ Tags are saved to macOS Finder metadata."""
     def resizeEvent(self, event):
         """Handle window resize."""
         super().resizeEvent(event)
-        self.update_display()
+        if self.current_pil_image is None:
+            return
+
+        if self.pixmap_cache.get(self.display_key()) is not None:
+            self.update_display()
+        else:
+            # Resize events stream in while dragging: show a cheap Qt-scaled
+            # preview now and only do the LANCZOS resize once they stop
+            self.preview_display()
+            self._resize_timer.start()
 
 
 def is_appledouble_file(file_path):
@@ -526,6 +709,24 @@ def is_appledouble_file(file_path):
     return file_path.name.startswith("._") and file_path.stat().st_size == 4096
 
 
+def list_images(directory):
+    """List image files in a directory, sorted by name."""
+    # os.scandir gives names and file types without a Path/stat per entry
+    images = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            name = entry.name
+            dot = name.rfind(".")
+            if dot < 0 or name[dot:].lower() not in IMAGE_EXTENSIONS or not entry.is_file():
+                continue
+            image = Path(entry.path)
+            if not is_appledouble_file(image):
+                images.append(image)
+
+    images.sort(key=lambda p: p.name)
+    return images
+
+
 def collect_images(path):
     """Collect all image files from a file or directory."""
     path = Path(path)
@@ -537,14 +738,11 @@ def collect_images(path):
     if path.is_file():
         if path.suffix.lower() in IMAGE_EXTENSIONS:
             # If a file is provided, show all images in its directory
-            parent_dir = path.parent
-            all_images = [f for f in parent_dir.iterdir()
-                         if f.is_file() and f.suffix.lower() in IMAGE_EXTENSIONS
-                         and not is_appledouble_file(f)]
-            # Find the starting index
-            try:
-                start_index = all_images.index(path)
-            except ValueError:
+            all_images = list_images(path.parent)
+            # Find the starting index (binary search, the list is sorted by name)
+            names = [f.name for f in all_images]
+            start_index = bisect.bisect_left(names, path.name)
+            if start_index >= len(names) or names[start_index] != path.name:
                 start_index = 0
             return all_images, start_index
         else:
@@ -553,9 +751,7 @@ def collect_images(path):
 
     elif path.is_dir():
         # Collect all images from directory
-        images = [f for f in path.iterdir()
-                 if f.is_file() and f.suffix.lower() in IMAGE_EXTENSIONS
-                 and not is_appledouble_file(f)]
+        images = list_images(path)
         if not images:
             print(f"Error: No images found in directory: {path}", file=sys.stderr)
             sys.exit(1)
@@ -1,5 +1,6 @@
 import argparse
 import sys
+from contextlib import ExitStack
 
 from exiftool import ExifToolHelper
 
@@ -32,25 +33,23 @@ def serialize(tags):
     return "|".join([str(tags.get(t, "NONE")) for t in TAGS])
 
 
-def get_tags(file, human=False):
-    if human:
-        common_args = ["-G"]
-    else:
-        common_args = ["-G", "-n"]
+# Machine-readable values (-n) for matching recipes, human-readable ones for display.
+# -fast skips scanning to the end of the file; MakerNotes are still read (-fast2
+# would skip them, and the recipe tags live there)
+MACHINE_ARGS = ["-fast", "-G", "-n"]
+HUMAN_ARGS = ["-fast", "-G"]
 
-    with ExifToolHelper(common_args=common_args) as et:
-        tags = et.get_tags(file, tags=(TAGS + [RECIPE_INFO_TAG]))[0]
 
-    return tags
+def get_tags(et, files):
+    return et.get_tags(files, tags=(TAGS + [RECIPE_INFO_TAG]))
 
 
-def write_recipe_info(file, recipe_info_data):
-    with ExifToolHelper() as et:
-        et.set_tags(
-            file,
-            tags={RECIPE_INFO_TAG: recipe_info_data},
-            params=["-overwrite_original"],
-        )
+def write_recipe_info(et, file, recipe_info_data):
+    et.set_tags(
+        file,
+        tags={RECIPE_INFO_TAG: recipe_info_data},
+        params=["-overwrite_original"],
+    )
 
 
 if __name__ == "__main__":
@@ -61,32 +60,47 @@ if __name__ == "__main__":
 
     recipes_dict = dict([r.strip().split(",", 2) for r in RECIPES.strip().split("\n")])
 
-    for file in args.files:
-        msg = file
-
-        tags = get_tags(file)
-        recipe_id = serialize(tags)
-
-        recipe = recipes_dict.get(recipe_id, None)
-        if recipe is not None:
-            msg += f" -- Recipe: {recipe}"
-            if args.tag and tags.get(RECIPE_INFO_TAG) != recipe:
-                write_recipe_info(file, recipe)
-                msg += " [successfully tagged]"
-            print(msg)
-        else:
-            tags = get_tags(file, human=True)
-
-            try:
-                del tags["SourceFile"]
-                del tags[RECIPE_INFO_TAG]
-            except KeyError:
-                pass
-
-            print(msg)
-
-            for tag, value in tags.items():
-                print(f"  {tag}: {value}")
-            print(f"  RecipeId: {recipe_id}")
-
-        sys.stdout.flush()
+    # Each ExifToolHelper is a long-running exiftool process: query all files in
+    # one call, then fetch human-readable tags in one more call for the files
+    # that matched no recipe
+    with ExitStack() as stack:
+        et = stack.enter_context(ExifToolHelper(common_args=MACHINE_ARGS))
+
+        all_tags = get_tags(et, args.files)
+        recipe_ids = [serialize(tags) for tags in all_tags]
+
+        unmatched = [
+            file for file, recipe_id in zip(args.files, recipe_ids)
+            if recipe_id not in recipes_dict
+        ]
+        human_tags = {}
+        if unmatched:
+            human_et = stack.enter_context(ExifToolHelper(common_args=HUMAN_ARGS))
+            human_tags = dict(zip(unmatched, get_tags(human_et, unmatched)))
+
+        for file, tags, recipe_id in zip(args.files, all_tags, recipe_ids):
+            msg = file
+
+            recipe = recipes_dict.get(recipe_id, None)
+            if recipe is not None:
+                msg += f" -- Recipe: {recipe}"
+                if args.tag and tags.get(RECIPE_INFO_TAG) != recipe:
+                    write_recipe_info(et, file, recipe)
+                    msg += " [successfully tagged]"
+                print(msg)
+            else:
+                tags = human_tags[file]
+
+                try:
+                    del tags["SourceFile"]
+                    del tags[RECIPE_INFO_TAG]
+                except KeyError:
+                    pass
+
+                print(msg)
+
+                for tag, value in tags.items():
+                    print(f"  {tag}: {value}")
+                print(f"  RecipeId: {recipe_id}")
+
+            sys.stdout.flush()
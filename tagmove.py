@@ -21,10 +21,13 @@ Tag processing:
 """
 
 import argparse
+import errno
+import filecmp
+import os
 import shutil
 import sys
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple
 
 from osxmetadata import (
     OSXMetaData,
@@ -61,18 +64,22 @@ def get_file_tags(path: Path) -> List[Tag]:
         return []
 
 
-def find_corresponding_raf(jpg_path: Path) -> Optional[Path]:
-    """Find the corresponding RAF file for a JPG file."""
-    raf_path = jpg_path.with_suffix('.RAF')
-    if raf_path.exists():
-        return raf_path
-
-    # Try lowercase
-    raf_path = jpg_path.with_suffix('.raf')
-    if raf_path.exists():
-        return raf_path
-
-    return None
+def build_raf_index(source_dir: Path) -> Dict[str, Path]:
+    """
+    Map lowercased file stem to RAF path for all RAF files in source directory (non-recursive).
+    Lowercased to match like macOS's default case-insensitive filesystem does.
+    """
+    raf_index = {}
+    with os.scandir(source_dir) as entries:
+        for entry in entries:
+            stem, dot, ext = entry.name.rpartition('.')
+            if not dot or ext.lower() != 'raf' or not entry.is_file():
+                continue
+            # Prefer .RAF over other spellings of the extension
+            key = stem.lower()
+            if ext == 'RAF' or key not in raf_index:
+                raf_index[key] = Path(entry.path)
+    return raf_index
 
 
 def discover_jpg_files(source_dir: Path) -> List[Path]:
@@ -106,6 +113,9 @@ def process_tagged_images(
     jpg_files = discover_jpg_files(source_dir)
     print(f"Found {len(jpg_files)} JPG files")
 
+    # One directory pass instead of probing for a RAF per JPG
+    raf_index = build_raf_index(source_dir)
+
     # Collect actions to perform
     actions = []
     errors = []
@@ -115,10 +125,13 @@ def process_tagged_images(
 
         # Check each tag and queue appropriate actions
         for tag in tags:
-            if tag not in TAG_ACTIONS:
+            # Match the exact tag (name and color), so custom tags that merely
+            # share a color don't trigger moves
+            action = TAG_ACTIONS.get(tag)
+            if action is None:
                 continue
 
-            subdir, file_type, operation = TAG_ACTIONS[tag]
+            subdir, file_type, operation = action
             target_subdir = target_dir / subdir
 
             if file_type == "jpg":
@@ -127,7 +140,7 @@ def process_tagged_images(
 
             elif file_type == "raf":
                 # Copy/move RAF
-                raf_path = find_corresponding_raf(jpg_path)
+                raf_path = raf_index.get(jpg_path.stem.lower())
                 if raf_path:
                     actions.append((raf_path, target_subdir / raf_path.name, operation))
                 else:
@@ -136,7 +149,7 @@ def process_tagged_images(
             elif file_type == "both":
                 # Copy/move both JPG and RAF
                 actions.append((jpg_path, target_subdir / jpg_path.name, operation))
-                raf_path = find_corresponding_raf(jpg_path)
+                raf_path = raf_index.get(jpg_path.stem.lower())
                 if raf_path:
                     actions.append((raf_path, target_subdir / raf_path.name, operation))
                 else:
@@ -144,12 +157,7 @@ def process_tagged_images(
                     pass
 
     # Remove duplicates while preserving order
-    seen = set()
-    unique_actions = []
-    for action in actions:
-        if action not in seen:
-            seen.add(action)
-            unique_actions.append(action)
+    unique_actions = list(dict.fromkeys(actions))
 
     # Report what will happen
     copy_actions = [a for a in unique_actions if a[2] == "copy"]
@@ -187,9 +195,13 @@ def process_tagged_images(
                 # Create target directory if needed
                 target.parent.mkdir(parents=True, exist_ok=True)
 
-                # Check if target already exists
+                # Check if target already exists. filecmp compares sizes before
+                # reading any content, so differing files are caught cheaply
                 if target.exists():
-                    print(f"  Skipping {source.name} - already exists at {target}")
+                    if filecmp.cmp(source, target, shallow=False):
+                        print(f"  Skipping {source.name} - already exists at {target}")
+                    else:
+                        errors.append((source, f"Different file already exists at {target}"))
                     continue
 
                 # Perform operation
@@ -197,7 +209,14 @@ def process_tagged_images(
                     shutil.copy2(source, target)
                     print(f"  Copied {source.name} -> {target.parent.name}/")
                 elif operation == "move":
-                    shutil.move(str(source), str(target))
+                    try:
+                        # Single rename syscall, skipping shutil's extra checks
+                        os.replace(source, target)
+                    except OSError as e:
+                        if e.errno != errno.EXDEV:
+                            raise
+                        # Different filesystems: copy (keeping timestamps) then unlink
+                        shutil.move(str(source), str(target))
                     print(f"  Moved {source.name} -> {target.parent.name}/")
 
             except Exception as e: